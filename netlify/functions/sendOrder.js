@@ -1,10 +1,23 @@
+// built once per container, reused across warm invocations
+const RESEND_HEADERS = {
+  Authorization: `Bearer ${process.env.RESEND_API_KEY}`,
+  "Content-Type": "application/json",
+};
+
+// static part of the CORS headers; only the origin varies per request
+const CORS_HEADERS = {
+  "Access-Control-Allow-Methods": "POST, OPTIONS",
+  "Access-Control-Allow-Headers": "Content-Type",
+};
+
+const EMAIL_REGEX = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
+// fail fast before Netlify's 10s function limit kills the invocation
+const UPSTREAM_TIMEOUT_MS = 8000;
+
 export async function handler(event, context) {
   const origin = event.headers.origin || "*";
-  const cors = {
-    "Access-Control-Allow-Origin": origin,
-    "Access-Control-Allow-Methods": "POST, OPTIONS",
-    "Access-Control-Allow-Headers": "Content-Type",
-  };
+  const cors = { ...CORS_HEADERS, "Access-Control-Allow-Origin": origin };
 
   if (event.httpMethod === "OPTIONS") {
     return { statusCode: 204, headers: cors };
@@ -15,7 +28,20 @@ export async function handler(event, context) {
 
   try {
     // --- parse body ---
-    const data = JSON.parse(event.body || "{}");
+    let data;
+    try {
+      data = JSON.parse(event.body || "{}");
+    } catch {
+      data = null;
+    }
+    // valid JSON that isn't a plain object (null, arrays, scalars) is just as unusable
+    if (typeof data !== "object" || data === null || Array.isArray(data)) {
+      return {
+        statusCode: 400,
+        headers: cors,
+        body: JSON.stringify({ ok: false, error: "Invalid JSON body" }),
+      };
+    }
     const { fullName, email, mobile, product, paymentMethod } = data;
 
     if (!fullName || !email || !product) {
@@ -27,8 +53,7 @@ export async function handler(event, context) {
     }
 
     // --- basic email validation ---
-    const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-    if (!emailRegex.test(email)) {
+    if (!EMAIL_REGEX.test(email)) {
       return {
         statusCode: 400,
         headers: cors,
@@ -56,13 +81,6 @@ export async function handler(event, context) {
       ],
     };
 
-    // send to discord
-    await fetch(process.env.DISCORD_WEBHOOK_URL, {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify(discordPayload),
-    });
-
     // --- Email confirmation via Resend ---
     const emailPayload = {
       from: "support@coramtix.in",
@@ -95,22 +113,70 @@ export async function handler(event, context) {
       `,
     };
 
-    await fetch("https://api.resend.com/emails", {
+    // one deadline shared by both calls so together they stay under the function limit
+    const deadline = AbortSignal.timeout(UPSTREAM_TIMEOUT_MS);
+
+    // --- send discord ticket ---
+    // no retries: both calls are non-idempotent POSTs and would duplicate the ticket
+    const discordRes = await fetch(process.env.DISCORD_WEBHOOK_URL, {
       method: "POST",
-      headers: {
-        Authorization: `Bearer ${process.env.RESEND_API_KEY}`,
-        "Content-Type": "application/json",
-      },
-      body: JSON.stringify(emailPayload),
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(discordPayload),
+      signal: deadline,
     });
 
+    // the discord ticket is the order of record; without it the order is lost
+    if (!discordRes.ok) {
+      console.error("Discord webhook error:", discordRes.status);
+      return {
+        statusCode: 502,
+        headers: cors,
+        body: JSON.stringify({ ok: false, error: "Could not create order ticket" }),
+      };
+    }
+
+    // --- confirmation email, only once the ticket exists ---
+    // from here on the order is placed, so an email failure must not fail the request
+    let emailError = null;
+    try {
+      const emailRes = await fetch("https://api.resend.com/emails", {
+        method: "POST",
+        headers: RESEND_HEADERS,
+        body: JSON.stringify(emailPayload),
+        signal: deadline,
+      });
+      if (!emailRes.ok) emailError = `status ${emailRes.status}`;
+    } catch (err) {
+      emailError = err.message;
+    }
+
+    if (emailError) {
+      console.error("Resend error:", emailError);
+      return {
+        statusCode: 200,
+        headers: cors,
+        body: JSON.stringify({ ok: true, emailSent: false, message: "Order ticket created, confirmation email failed" }),
+      };
+    }
+
     return {
       statusCode: 200,
       headers: cors,
-      body: JSON.stringify({ ok: true, message: "Order ticket created & email sent" }),
+      body: JSON.stringify({ ok: true, emailSent: true, message: "Order ticket created & email sent" }),
     };
   } catch (err) {
     console.error("Function error:", err.message);
+    // a timed-out webhook may still have been delivered, so the outcome is unknown
+    if (err.name === "TimeoutError") {
+      return {
+        statusCode: 504,
+        headers: cors,
+        body: JSON.stringify({
+          ok: false,
+          error: "Order may have been received. Please check your email or contact us before resubmitting.",
+        }),
+      };
+    }
     return {
       statusCode: 500,
       headers: cors,
@@ -2,10 +2,13 @@
 document.getElementById('copyright-year').textContent = new Date().getFullYear();
 
 const cooldownSeconds = 3000; // anti-spam cooldown
-let lastSubmitTime = 0;
+let lastSubmitTime = -Infinity; // performance.now() timestamp, immune to clock changes
+let submitting = false; // blocks duplicate orders while a request is in flight
+const submitTimeoutMs = 15000; // above the function's 10s limit, so only a stalled connection trips it
 
 document.getElementById('orderForm').addEventListener('submit', async (e) => {
   e.preventDefault();
+  if (submitting) return;
   const status = document.getElementById('orderStatus');
   status.className = 'text-center text-sm mt-2';
   status.textContent = '';
@@ -23,7 +26,7 @@ document.getElementById('orderForm').addEventListener('submit', async (e) => {
   }
 
   // cooldown anti-spam
-  const now = Date.now();
+  const now = performance.now();
   if (now - lastSubmitTime < cooldownSeconds * 1000) {
     const remaining = Math.ceil((cooldownSeconds * 1000 - (now - lastSubmitTime)) / 1000);
     status.textContent = `Please wait ${remaining}s before submitting again.`;
@@ -35,25 +38,51 @@ document.getElementById('orderForm').addEventListener('submit', async (e) => {
   const formData = new FormData(e.target);
   const payload = Object.fromEntries(formData.entries());
 
+  const submitBtn = e.target.querySelector('button[type="submit"]');
+  submitting = true;
+  submitBtn.disabled = true;
+  submitBtn.classList.add('opacity-50');
+
   try {
     const res = await fetch('/.netlify/functions/sendOrder', {
       method: 'POST',
       headers: {'Content-Type': 'application/json'},
-      body: JSON.stringify(payload)
+      body: JSON.stringify(payload),
+      signal: AbortSignal.timeout(submitTimeoutMs)
     });
     if (res.ok) {
       lastSubmitTime = now;
+      const result = await res.json().catch(() => ({}));
       status.textContent = '✅ Order submitted successfully. You will hear from us within 24 hours.';
+      if (result.emailSent === false) {
+        status.textContent += ' We could not send your confirmation email, so none will arrive.';
+      }
       status.classList.add('text-green-600');
       e.target.reset();
       document.getElementById('captchaCheck').checked = false;
+    } else if (res.status === 504) {
+      // the ticket may still have been created; start the cooldown to avoid a duplicate
+      lastSubmitTime = now;
+      status.textContent = '⚠️ Order may have been received. Please check your email or contact us before submitting again.';
+      status.classList.add('text-yellow-500');
     } else {
       const errText = await res.text();
       status.textContent = '❌ Failed to submit order. ' + errText;
       status.classList.add('text-red-500');
     }
   } catch (err) {
-    status.textContent = '❌ Network error. Please try again.';
-    status.classList.add('text-red-500');
+    if (err.name === 'TimeoutError') {
+      // the request may have reached the server, same as a 504
+      lastSubmitTime = now;
+      status.textContent = '⚠️ Order may have been received. Please check your email or contact us before submitting again.';
+      status.classList.add('text-yellow-500');
+    } else {
+      status.textContent = '❌ Network error. Please try again.';
+      status.classList.add('text-red-500');
+    }
+  } finally {
+    submitting = false;
+    submitBtn.disabled = false;
+    submitBtn.classList.remove('opacity-50');
   }
 });